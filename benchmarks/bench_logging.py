@@ -0,0 +1,141 @@
+"""Benchmark logging overhead on the tool-call hot path under concurrency.
+
+Usage:
+    python -m benchmarks.bench_logging [--requests 400] [--concurrency 32] [--tool-ms 200] [--log-file]
+
+Simulates `--concurrency` scrapes running at once, each binding a request id
+and executing a batch of tool calls through ToolHandler.execute_parallel with
+a stand-in tool that waits `--tool-ms` on I/O (about one page fetch; use a
+small value such as 2 to stress logging alone). The console sink (and the
+file sink with --log-file) is written to temporary files, and each run waits
+for background sinks to finish writing before the clock stops.
+
+Modes are interleaved across repeats. For each mode, reports the median
+wall-clock time, the wall-clock overhead relative to running with all sinks
+removed, and the extra process CPU time per request spent on logging.
+"""
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import contextvars
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+from loguru import logger
+
+from src.ai.utils.tool_handler import ToolHandler, ToolRegistry
+from src.utils.logging import configure_logging, flush_logging, new_request_id
+
+TOOL_CALLS_PER_REQUEST = 5
+
+# Seconds the stand-in tool waits; set from --tool-ms
+tool_io_seconds = 0.2
+
+
+def fake_fetch(url: str) -> str:
+    time.sleep(tool_io_seconds)
+    return json.dumps({"success": True, "url": url, "text": "x" * 2000})
+
+
+def make_tool_calls() -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            id=f"call_{i}",
+            function=SimpleNamespace(
+                name="fetch_page_text",
+                arguments=json.dumps({"url": f"https://example.com/page/{i}"}),
+            ),
+        )
+        for i in range(TOOL_CALLS_PER_REQUEST)
+    ]
+
+
+def one_request(handler: ToolHandler) -> None:
+    with logger.contextualize(request_id=new_request_id()):
+        logger.info("Starting agentic extraction for URL: {}", "https://example.com")
+        results = handler.execute_parallel(make_tool_calls())
+        handler.build_tool_response_message(results)
+
+
+def run(handler: ToolHandler, requests: int, concurrency: int) -> tuple[float, float]:
+    """Return (wall seconds, process CPU seconds) for one batch of requests."""
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, one_request, handler)
+            for _ in range(requests)
+        ]
+        for future in futures:
+            future.result()
+    # Count the time background sinks need to write everything out
+    logger.complete()
+    flush_logging()
+    return time.perf_counter() - start, time.process_time() - cpu_start
+
+
+def main() -> None:
+    global tool_io_seconds
+    parser = argparse.ArgumentParser(description="Logging overhead benchmark")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tool-ms", type=float, default=200.0, help="Stand-in tool I/O time")
+    parser.add_argument("--log-file", action="store_true", help="Also log to a rotating file")
+    args = parser.parse_args()
+    tool_io_seconds = args.tool_ms / 1000
+
+    modes = {
+        "disabled": None,
+        "text DEBUG": {"production": False, "level": "DEBUG"},
+        "prod DEBUG": {"production": True, "level": "DEBUG"},
+        "prod INFO": {"production": True, "level": "INFO"},
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        real_stderr = sys.stderr
+        sys.stderr = open(os.path.join(tmp, "stderr.log"), "w")
+        try:
+            logger.remove()
+            registry = ToolRegistry()
+            registry.register("fetch_page_text", {}, fake_fetch)
+            handler = ToolHandler(registry)
+            log_file = os.path.join(tmp, "scraper.log") if args.log_file else None
+
+            samples: dict[str, list[tuple[float, float]]] = {label: [] for label in modes}
+            for _ in range(args.repeat):
+                for label, options in modes.items():
+                    if options is None:
+                        logger.remove()
+                    else:
+                        configure_logging(log_file=log_file, **options)
+                    run(handler, args.concurrency, args.concurrency)
+                    samples[label].append(run(handler, args.requests, args.concurrency))
+                    logger.remove()
+        finally:
+            sys.stderr.close()
+            sys.stderr = real_stderr
+
+    wall = {label: statistics.median(w for w, _ in runs) for label, runs in samples.items()}
+    cpu = {label: statistics.median(c for _, c in runs) for label, runs in samples.items()}
+    print(
+        f"requests={args.requests} concurrency={args.concurrency} tool_ms={args.tool_ms} "
+        f"tool_calls_per_request={TOOL_CALLS_PER_REQUEST} log_file={args.log_file}"
+    )
+    for label in modes:
+        overhead = (wall[label] - wall["disabled"]) / wall["disabled"] * 100
+        extra_cpu = (cpu[label] - cpu["disabled"]) / args.requests * 1000
+        print(
+            f"{label:<11} wall={wall[label] * 1000:8.1f}ms overhead={overhead:6.1f}% "
+            f"logging_cpu_per_request={extra_cpu:6.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
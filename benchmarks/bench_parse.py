@@ -0,0 +1,99 @@
+"""Benchmark in-thread vs process-pool HTML parsing to find the crossover size.
+
+Usage:
+    SCRAPER_PARSE_WORKERS=auto python -m benchmarks.bench_parse [--concurrency 5] [--repeat 5]
+
+For each document size, parses `concurrency` documents at once from a thread
+pool (as ToolHandler.execute_parallel does) both in-thread and via the parse
+pool, and reports the median wall-clock time across repeats. The crossover is
+the smallest size from which the pool is at least --min-speedup faster at that
+size and every larger one; use it for SCRAPER_PARSE_INLINE_BYTES on the host.
+Also reports the one-off cost of the first pooled parse (worker spawn plus the
+bs4 import), which every process that enables the pool pays once.
+
+Run on the target hardware: on a single core the pool cannot beat in-thread
+parsing, so any difference there is noise.
+"""
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import os
+import statistics
+import time
+
+from src.scraper.parse_pool import get_parse_pool, parse_html, shutdown_parse_pool
+
+SIZES_KB = (8, 32, 64, 128, 256, 512, 1024, 2048)
+
+
+def make_html(size_bytes: int) -> bytes:
+    """Build a synthetic page of roughly size_bytes with text, links and scripts."""
+    block = (
+        "<div class='card'><h2>Feature heading</h2>"
+        "<p>Product description text with <b>emphasis</b> and <i>detail</i>.</p>"
+        "<a href='/pricing'>Pricing</a><a href='/about'>About us</a>"
+        "<script>var x = {a: 1, b: [1, 2, 3]};</script></div>\n"
+    )
+    body = block * (size_bytes // len(block) + 1)
+    return f"<html><head><title>Bench</title></head><body>{body}</body></html>".encode()
+
+
+def run(html: bytes, concurrency: int, inline_threshold: int) -> float:
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(parse_html, html, "utf-8", inline_threshold)
+            for _ in range(concurrency)
+        ]
+        for future in futures:
+            future.result()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTML parse pool crossover benchmark")
+    parser.add_argument("--concurrency", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-speedup", type=float, default=1.2)
+    args = parser.parse_args()
+
+    if get_parse_pool() is None:
+        raise SystemExit("Parse pool is disabled; set SCRAPER_PARSE_WORKERS=auto or a worker count")
+    cpus = os.cpu_count() or 1
+    if cpus < 2:
+        print("warning: single CPU; the pool cannot speed up parsing here and results are noise")
+
+    # The first pooled parses pay worker spawn and the bs4 import
+    cold = run(make_html(1024), cpus, inline_threshold=0)
+    warm = run(make_html(1024), cpus, inline_threshold=0)
+
+    print(f"cpus={cpus} concurrency={args.concurrency} repeat={args.repeat} min_speedup={args.min_speedup}")
+    print(f"pool cold start: {(cold - warm) * 1000:.1f}ms")
+    print(f"{'size_kb':>8} {'inline_ms':>10} {'pool_ms':>10} {'speedup':>8}")
+    speedups = []
+    for size_kb in SIZES_KB:
+        html = make_html(size_kb * 1024)
+        inline = statistics.median(
+            run(html, args.concurrency, inline_threshold=len(html) + 1) for _ in range(args.repeat)
+        )
+        pooled = statistics.median(
+            run(html, args.concurrency, inline_threshold=0) for _ in range(args.repeat)
+        )
+        speedups.append(inline / pooled)
+        print(f"{size_kb:>8} {inline * 1000:>10.1f} {pooled * 1000:>10.1f} {inline / pooled:>7.2f}x")
+
+    crossover = None
+    for index in range(len(SIZES_KB) - 1, -1, -1):
+        if speedups[index] < args.min_speedup:
+            break
+        crossover = SIZES_KB[index]
+    if cpus < 2:
+        print("crossover: not meaningful on a single CPU")
+    else:
+        print(f"crossover: {f'{crossover} KB' if crossover else 'not reached'}")
+    shutdown_parse_pool()
+
+
+if __name__ == "__main__":
+    main()
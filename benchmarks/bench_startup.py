@@ -0,0 +1,107 @@
+"""Benchmark cold-start cost of the CLI and API entry points.
+
+Usage:
+    python -m benchmarks.bench_startup [--repeat 5]
+
+Each measurement runs in a fresh interpreter so module caches do not carry
+over. Reports:
+
+- import time of src.main and src.api, and which heavy dependencies
+  (openai, httpx, bs4) were loaded as a side effect
+- CLI time-to-first-response: `python -m src.main --help`
+- API time-to-first-response: uvicorn process start until GET /health succeeds
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+HEAVY_MODULES = ("openai", "httpx", "bs4")
+
+IMPORT_PROBE = (
+    "import json, sys, time\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "elapsed = time.perf_counter() - start\n"
+    "print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))\n"
+)
+
+
+def measure_import(module: str) -> tuple[float, list[str]]:
+    code = IMPORT_PROBE.format(module=module, heavy=HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    return result["seconds"], result["loaded"]
+
+
+def measure_cli() -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "src.main", "--help"], capture_output=True, check=True
+    )
+    return time.perf_counter() - start
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_api(timeout: float = 30.0) -> float:
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.api:app", "--port", str(port), "--log-level", "warning"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError(f"API did not respond within {timeout}s")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def report(label: str, samples: list[float]) -> None:
+    print(
+        f"{label:<28} median={statistics.median(samples) * 1000:7.1f}ms "
+        f"min={min(samples) * 1000:7.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Entry point startup benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for module in ("src.main", "src.api"):
+        samples, loaded = [], []
+        for _ in range(args.repeat):
+            seconds, loaded = measure_import(module)
+            samples.append(seconds)
+        report(f"import {module}", samples)
+        print(f"{'':<28} heavy modules loaded: {', '.join(loaded) or 'none'}")
+
+    report("cli first response", [measure_cli() for _ in range(args.repeat)])
+    report("api first response", [measure_api() for _ in range(args.repeat)])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,24 @@
 """AI analysis engine for product intelligence."""
-from .analyzer import extract_product_snapshot
-from .agentic_analyzer import extract_product_snapshot_agentic
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .analyzer import extract_product_snapshot
+    from .agentic_analyzer import extract_product_snapshot_agentic
+
+# Analyzers pull in openai, httpx and bs4; import them on first attribute access
+_EXPORTS = {
+    "extract_product_snapshot": ".analyzer",
+    "extract_product_snapshot_agentic": ".agentic_analyzer",
+}
 
 __all__ = ["extract_product_snapshot", "extract_product_snapshot_agentic"]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
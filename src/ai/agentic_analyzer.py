@@ -1,14 +1,20 @@
 """Agentic analyzer using function calling for product extraction."""
 from __future__ import annotations
 
+import concurrent.futures
+import contextvars
 import json
-from openai import AzureOpenAI
+from typing import TYPE_CHECKING
 from loguru import logger
 
 from ..schemas.product import ProductSnapshot
+from ..scraper.discovery import DISCOVERY_BUDGET_SECONDS, discover_site_map
 from .tools.fetcher import fetch_page_text, get_fetch_page_text_tool
 from .utils.tool_handler import ToolHandler, ToolRegistry
 
+if TYPE_CHECKING:
+    from openai import AzureOpenAI
+
 
 AGENTIC_SYSTEM_PROMPT = (
     "You are an agentic product intelligence assistant. Your task is to extract structured "
@@ -31,13 +37,43 @@ AGENTIC_SYSTEM_PROMPT = (
 )
 
 
+def _prefetch(initial_url: str) -> tuple[str, str | None]:
+    """Fetch the initial page and discover the site map concurrently.
+
+    Discovery is bounded by its own budget; if it still has not returned
+    shortly after that, the agent starts without a site map.
+    """
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    try:
+        page_future = executor.submit(contextvars.copy_context().run, fetch_page_text, initial_url)
+        site_map_future = executor.submit(contextvars.copy_context().run, discover_site_map, initial_url)
+        
+        try:
+            site_map = site_map_future.result(timeout=DISCOVERY_BUDGET_SECONDS + 1.0).to_prompt()
+        except concurrent.futures.TimeoutError:
+            logger.warning(f"Site discovery exceeded its budget for {initial_url}")
+            site_map = None
+        except Exception as e:
+            logger.warning(f"Site discovery failed for {initial_url}: {str(e)}")
+            site_map = None
+        
+        try:
+            homepage = page_future.result()
+        except Exception as e:
+            homepage = json.dumps({"success": False, "error": str(e)})
+    finally:
+        executor.shutdown(wait=False)
+    
+    return homepage, site_map
+
+
 def extract_product_snapshot_agentic(
     client: AzureOpenAI,
     deployment: str,
     initial_url: str,
 ) -> ProductSnapshot:
     """Extract product data using agentic function calling."""
-    logger.info(f"Starting agentic extraction for URL: {initial_url}")
+    logger.info("Starting agentic extraction for URL: {}", initial_url)
     
     # Setup tool registry and handler
     registry = ToolRegistry()
@@ -49,17 +85,22 @@ def extract_product_snapshot_agentic(
     tool_handler = ToolHandler(registry)
     
     tools = registry.get_all_schemas()
-    logger.debug(f"Registered {len(tools)} tool(s)")
+    logger.debug("Registered {} tool(s)", len(tools))
+    
+    homepage, site_map = _prefetch(initial_url)
     
     messages = [
         {
             "role": "user",
             "content": (
                 f"Extract product information and create a ProductSnapshot from this URL: {initial_url}\n\n"
-                "Use the fetch_page_text tool to retrieve content from the URL and any related pages you need. "
+                "The page content and a ranked map of key pages on the site are provided below. "
+                "Use the fetch_page_text tool to retrieve any related pages you need, preferring the "
+                "discovered key pages, and fetch several of them in a single turn where possible. "
                 "Then provide your analysis in the ProductSnapshot format as a valid JSON object.\n\n"
-                "Only return valid JSON for the ProductSnapshot, no other text. "
-                "Make sure to use the fetch_page_text tool to get the actual page content before analyzing."
+                "Only return valid JSON for the ProductSnapshot, no other text.\n\n"
+                f"Key pages discovered on this site:\n{site_map or 'none found'}\n\n"
+                f"fetch_page_text result for {initial_url}:\n{homepage}"
             )
         }
     ]
@@ -69,7 +110,7 @@ def extract_product_snapshot_agentic(
     
     while iteration < max_iterations:
         iteration += 1
-        logger.debug(f"Agentic loop iteration {iteration}/{max_iterations}")
+        logger.debug("Agentic loop iteration {}/{}", iteration, max_iterations)
         
         response = client.beta.chat.completions.parse(
             model=deployment,
@@ -80,7 +121,7 @@ def extract_product_snapshot_agentic(
         
         if response.choices[0].message.tool_calls:
             tool_calls = response.choices[0].message.tool_calls
-            logger.info(f"LLM called {len(tool_calls)} tool(s)")
+            logger.info("LLM called {} tool(s)", len(tool_calls))
             
             messages.append({
                 "role": "assistant",
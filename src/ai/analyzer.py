@@ -1,10 +1,13 @@
 """LLM-based analysis for structured product data extraction."""
 from __future__ import annotations
 
-from openai import AzureOpenAI
+from typing import TYPE_CHECKING
 
 from ..schemas.product import ProductSnapshot
 
+if TYPE_CHECKING:
+    from openai import AzureOpenAI
+
 PRODUCT_ANALYSIS_SYSTEM_PROMPT = (
     "You are a product intelligence assistant generating data for a catalog. "
     "Always populate the ProductSnapshot schema exactly, using only evidence from the page "
@@ -19,15 +22,17 @@ def extract_product_snapshot(
     deployment: str,
     url: str,
     page_text: str,
+    site_map: str | None = None,
 ) -> ProductSnapshot:
     """Extract structured product data from page content using Azure OpenAI.
-    
+
     Args:
         client: Configured Azure OpenAI client
         deployment: Model deployment name
         url: Source URL of the content
         page_text: Cleaned text content from webpage
-        
+        site_map: Optional ranked site map from discover_site_map
+
     Returns:
         ProductSnapshot with extracted product intelligence
     """
@@ -35,8 +40,11 @@ def extract_product_snapshot(
         "Use the webpage content to complete the ProductSnapshot schema. "
         "Stay faithful to verified details, prefer official data, and do not fabricate. "
         "If a field is unknown, return null."
-        f"\n\nURL: {url}\n\nWebpage content:\n{page_text}"
+        f"\n\nURL: {url}"
     )
+    if site_map:
+        user_prompt += f"\n\nKey pages discovered on this site:\n{site_map}"
+    user_prompt += f"\n\nWebpage content:\n{page_text}"
     completion = client.beta.chat.completions.parse(
         model=deployment,
         messages=[
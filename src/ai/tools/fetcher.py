@@ -3,13 +3,15 @@ from __future__ import annotations
 
 import json
 import httpx
-from bs4 import BeautifulSoup
 from loguru import logger
 
+from ...scraper.parse_pool import parse_html
+from ...utils.logging import sampled_logger
+
 
 def fetch_page_text(url: str) -> str:
     """Fetch a URL and extract visible text content."""
-    logger.debug(f"Fetching URL: {url}")
+    sampled_logger.debug("Fetching URL: {}", url)
     
     if not url.startswith(("http://", "https://")):
         logger.error(f"Invalid URL format: {url}")
@@ -23,8 +25,9 @@ def fetch_page_text(url: str) -> str:
         with httpx.Client(follow_redirects=True, timeout=30.0, headers=headers) as client:
             response = client.get(url)
             response.raise_for_status()
-            html = response.text
-            logger.debug(f"Successfully fetched {len(html)} bytes from {url}")
+            html = response.content
+            encoding = response.charset_encoding
+            sampled_logger.debug("Successfully fetched {} bytes from {}", len(html), url)
     except httpx.HTTPError as e:
         logger.error(f"HTTP error fetching {url}: {str(e)}")
         return json.dumps({
@@ -32,24 +35,9 @@ def fetch_page_text(url: str) -> str:
             "error": f"Failed to fetch URL: {str(e)}"
         })
     
-    soup = BeautifulSoup(html, "html.parser")
-    for tag in soup(["script", "style", "noscript", "svg"]):
-        tag.decompose()
-    text_chunks = [chunk.strip() for chunk in soup.stripped_strings if chunk.strip()]
-    text = " \n".join(text_chunks)
-    
-    # Extract all href links with their text
-    links = []
-    for link in soup.find_all("a", href=True):
-        href = link.get("href", "").strip()
-        link_text = link.get_text(strip=True)
-        if href and href != "#":
-            links.append({
-                "href": href,
-                "text": link_text if link_text else "[no text]"
-            })
+    text, links = parse_html(html, encoding)
     
-    logger.info(f"Extracted {len(text)} chars and {len(links)} links from {url}")
+    sampled_logger.info("Extracted {} chars and {} links from {}", len(text), len(links), url)
     return json.dumps({
         "success": True,
         "url": url,
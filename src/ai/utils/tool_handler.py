@@ -1,11 +1,14 @@
 """Tool handler for managing LLM tool calls."""
 from __future__ import annotations
 
+import contextvars
 import json
 from typing import Callable, Any, Optional
 from dataclasses import dataclass
 from loguru import logger
 
+from ...utils.logging import sampled_logger
+
 
 @dataclass
 class ToolResult:
@@ -27,7 +30,7 @@ class ToolRegistry:
         """Register a tool with its schema and handler function."""
         self._tools[name] = schema
         self._handlers[name] = handler
-        logger.debug(f"Tool registered: {name}", extra={"handler": handler.__name__})
+        logger.debug("Tool registered: {}", name, extra={"handler": handler.__name__})
     
     def get_schema(self, name: str) -> Optional[dict]:
         """Get tool schema by name."""
@@ -57,7 +60,7 @@ class ToolHandler:
         name = tool_call.function.name
         call_id = tool_call.id
         
-        logger.debug(f"Executing tool: {name} (call_id: {call_id})")
+        sampled_logger.debug("Executing tool: {} (call_id: {})", name, call_id)
         
         handler = self.registry.get_handler(name)
         if not handler:
@@ -71,9 +74,9 @@ class ToolHandler:
         
         try:
             args = json.loads(tool_call.function.arguments)
-            logger.debug(f"Tool arguments: {args}")
+            sampled_logger.debug("Tool arguments: {}", args)
             result = handler(**args)
-            logger.info(f"Tool executed successfully: {name}", extra={"call_id": call_id})
+            sampled_logger.info("Tool executed successfully: {}", name, extra={"call_id": call_id})
             return ToolResult(
                 call_id=call_id,
                 name=name,
@@ -93,21 +96,29 @@ class ToolHandler:
         """Execute multiple tool calls in parallel."""
         import concurrent.futures
         
-        logger.info(f"Executing {len(tool_calls)} tool calls in parallel")
+        sampled_logger.info("Executing {} tool calls in parallel", len(tool_calls))
         
         results = []
         with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(self.execute_tool_call, tc) for tc in tool_calls]
+            # Run each call in a copy of the caller's context so bound log fields (request_id) carry over
+            futures = [
+                executor.submit(contextvars.copy_context().run, self.execute_tool_call, tc)
+                for tc in tool_calls
+            ]
             for future in concurrent.futures.as_completed(futures):
                 results.append(future.result())
         
         sorted_results = sorted(results, key=lambda r: tool_calls.index(next(tc for tc in tool_calls if tc.id == r.call_id)))
-        logger.debug(f"Parallel execution completed: {len(sorted_results)} results", extra={"success_count": sum(1 for r in sorted_results if r.success)})
+        sampled_logger.opt(lazy=True).debug(
+            "Parallel execution completed: {} results ({} succeeded)",
+            lambda: len(sorted_results),
+            lambda: sum(1 for r in sorted_results if r.success),
+        )
         return sorted_results
     
     def build_tool_response_message(self, results: list[ToolResult]) -> dict:
         """Build the tool response message to append to conversation."""
-        logger.debug(f"Building response message for {len(results)} tool results")
+        sampled_logger.debug("Building response message for {} tool results", len(results))
         return {
             "role": "user",
             "content": [
@@ -1,16 +1,38 @@
 """FastAPI application for product scraping and analysis."""
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from pydantic import BaseModel, Field
 from fastapi import FastAPI, HTTPException
 
 from .main import scrape_and_analyze
 from .schemas.product import ProductSnapshot
+from .utils.logging import configure_logging_from_env
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    configure_logging_from_env()
+    # parse_pool is cheap to import; bs4 and the workers load only when the pool is enabled
+    from .scraper.parse_pool import parse_pool_enabled, shutdown_parse_pool, warm_parse_pool
+
+    if not parse_pool_enabled():
+        yield
+        return
+    await asyncio.to_thread(warm_parse_pool)
+    try:
+        yield
+    finally:
+        shutdown_parse_pool()
+
 
 app = FastAPI(
     title="Product Scraper Engine",
     description="API for scraping and analyzing product information from URLs",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
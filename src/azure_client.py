@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import os
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 
 from dotenv import load_dotenv
-from openai import AzureOpenAI
+
+if TYPE_CHECKING:
+    from openai import AzureOpenAI
 
 DEFAULT_API_VERSION = "2024-02-01"
 
@@ -17,8 +19,10 @@ def _require_env(name: str) -> str:
     return value
 
 
-def load_client() -> Tuple[AzureOpenAI, str]:
+def load_client() -> Tuple["AzureOpenAI", str]:
     """Return a configured Azure OpenAI client and deployment name."""
+    from openai import AzureOpenAI
+
     load_dotenv()
     endpoint = _require_env("AZURE_OPENAI_ENDPOINT")
     api_key = _require_env("AZURE_OPENAI_API_KEY")
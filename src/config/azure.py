@@ -2,17 +2,19 @@
 from __future__ import annotations
 
 import os
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 
 from dotenv import load_dotenv
-from openai import AzureOpenAI
 
 from ..utils import get_required_env_var
 
+if TYPE_CHECKING:
+    from openai import AzureOpenAI
+
 DEFAULT_API_VERSION = "2024-02-01"
 
 
-def load_azure_openai_client() -> Tuple[AzureOpenAI, str]:
+def load_azure_openai_client() -> Tuple["AzureOpenAI", str]:
     """Load and return a configured Azure OpenAI client with deployment name.
     
     Returns:
@@ -21,6 +23,8 @@ def load_azure_openai_client() -> Tuple[AzureOpenAI, str]:
     Raises:
         RuntimeError: If required environment variables are missing.
     """
+    from openai import AzureOpenAI
+
     load_dotenv()
     endpoint = get_required_env_var("AZURE_OPENAI_ENDPOINT")
     api_key = get_required_env_var("AZURE_OPENAI_API_KEY")
@@ -4,15 +4,26 @@ from __future__ import annotations
 import argparse
 from loguru import logger
 
-from .config import load_azure_openai_client
-from .ai.agentic_analyzer import extract_product_snapshot_agentic
-from .utils.logging import configure_logging
+from .utils.logging import configure_logging, new_request_id
 
 
-def scrape_and_analyze(url: str, out_path: str | None = None) -> str:
-    """Analyze a product page using agentic function calling."""
-    client, deployment = load_azure_openai_client()
-    result = extract_product_snapshot_agentic(client, deployment, url)
+def scrape_and_analyze(
+    url: str,
+    out_path: str | None = None,
+    request_id: str | None = None,
+) -> str:
+    """Analyze a product page using agentic function calling.
+    
+    All log records emitted during the scrape, including those from tool
+    threads, carry request_id (generated if not given) in their extra data.
+    """
+    # Deferred so that importing this module (and --help) skips openai, httpx and bs4
+    from .config import load_azure_openai_client
+    from .ai.agentic_analyzer import extract_product_snapshot_agentic
+    
+    with logger.contextualize(request_id=request_id or new_request_id()):
+        client, deployment = load_azure_openai_client()
+        result = extract_product_snapshot_agentic(client, deployment, url)
     
     payload = result.model_dump_json(indent=2, ensure_ascii=False)
     
@@ -46,9 +57,27 @@ def cli() -> None:
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
         help="Log level (default: INFO)",
     )
+    parser.add_argument(
+        "--log-mode",
+        type=str,
+        default="text",
+        choices=["text", "production"],
+        help="Log output mode; production emits sampled JSON through non-blocking sinks (default: text)",
+    )
+    parser.add_argument(
+        "--log-sample-rate",
+        type=float,
+        default=None,
+        help="Fraction of fetch/tool debug and info events to keep (default: 1.0, or 0.1 in production mode)",
+    )
     args = parser.parse_args()
     
-    configure_logging(level=args.log_level, log_file=args.log)
+    configure_logging(
+        level=args.log_level,
+        log_file=args.log,
+        production=args.log_mode == "production",
+        sample_rate=args.log_sample_rate,
+    )
     logger.info(f"Starting scraper for URL: {args.url}")
     
     result = scrape_and_analyze(args.url, args.out)
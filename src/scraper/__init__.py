@@ -1,5 +1,32 @@
 """Scraper engine for fetching and parsing web content."""
-from .fetcher import fetch_page
-from .parser import extract_visible_text
+from __future__ import annotations
 
-__all__ = ["fetch_page", "extract_visible_text"]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .discovery import SiteMap, discover_site_map
+    from .fetcher import fetch_page
+    from .parse_pool import parse_html, shutdown_parse_pool
+    from .parser import extract_text_and_links, extract_visible_text
+
+# Submodules pull in httpx and bs4; import them on first attribute access so
+# parse pool workers only load what they use
+_EXPORTS = {
+    "fetch_page": ".fetcher",
+    "extract_visible_text": ".parser",
+    "extract_text_and_links": ".parser",
+    "parse_html": ".parse_pool",
+    "shutdown_parse_pool": ".parse_pool",
+    "discover_site_map": ".discovery",
+    "SiteMap": ".discovery",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
@@ -0,0 +1,330 @@
+"""Site structure discovery via robots.txt, sitemaps and well-known paths."""
+from __future__ import annotations
+
+import concurrent.futures
+import contextvars
+import gzip
+import io
+import json
+import re
+import time
+import uuid
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from urllib.parse import urljoin, urlparse
+
+import httpx
+
+from ..utils.logging import sampled_logger
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+# Keywords matched against URL path segments, per page category
+CATEGORY_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "about": ("about", "about-us", "aboutus", "who-we-are", "our-story", "mission"),
+    "pricing": ("pricing", "prices", "plans", "plans-pricing", "buy"),
+    "contact": ("contact", "contact-us", "contactus", "get-in-touch", "support", "demo"),
+    "company": ("company", "team", "leadership", "management", "careers", "press", "investors"),
+    "product": ("product", "products", "features", "platform", "solutions"),
+}
+
+# Well-known paths probed directly when the sitemap is missing or incomplete
+COMMON_PATHS = (
+    "/about",
+    "/about-us",
+    "/company",
+    "/pricing",
+    "/plans",
+    "/contact",
+    "/contact-us",
+    "/team",
+    "/leadership",
+    "/products",
+)
+
+MAX_SITEMAPS = 10
+MAX_SITEMAP_BYTES = 10 * 1024 * 1024
+MAX_PAGES_PER_CATEGORY = 3
+
+# Overall wall-clock budget for discovery; partial results are returned when it runs out
+DISCOVERY_BUDGET_SECONDS = 5.0
+
+_TOKEN_SEPARATORS = re.compile(r"[-_.]")
+
+# InvalidURL is not an HTTPError; malformed sitemap <loc> values raise it
+_REQUEST_ERRORS = (httpx.HTTPError, httpx.InvalidURL)
+
+
+@dataclass
+class DiscoveredPage:
+    """A candidate page found during discovery."""
+    url: str
+    category: str
+    source: str
+    score: float
+
+
+@dataclass
+class SiteMap:
+    """Ranked, compact view of a site's key pages."""
+    base_url: str
+    pages: list[DiscoveredPage] = field(default_factory=list)
+    sitemaps: list[str] = field(default_factory=list)
+
+    def by_category(self) -> dict[str, list[str]]:
+        """Group page URLs by category, best-ranked first."""
+        grouped: dict[str, list[str]] = {}
+        for page in sorted(self.pages, key=lambda p: p.score, reverse=True):
+            urls = grouped.setdefault(page.category, [])
+            if len(urls) < MAX_PAGES_PER_CATEGORY:
+                urls.append(page.url)
+        return grouped
+
+    def to_prompt(self) -> str:
+        """Render the site map as compact JSON for inclusion in an LLM prompt."""
+        return json.dumps({"base_url": self.base_url, "pages": self.by_category()})
+
+
+def _origin(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def _classify(url: str) -> tuple[str, float] | None:
+    """Return the best (category, score) for a URL, or None if irrelevant."""
+    path = urlparse(url).path.lower().strip("/")
+    if not path:
+        return None
+    segments = path.split("/")
+    best: tuple[str, float] | None = None
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        for depth, segment in enumerate(segments):
+            if segment in keywords:
+                # Exact segment hits near the root rank highest
+                score = 10.0 - depth * 2 - len(segments) * 0.5
+            elif any(token in keywords for token in _TOKEN_SEPARATORS.split(segment)):
+                # Whole-token hits only, so "wordpress" or "steam" do not match
+                score = 5.0 - depth * 2 - len(segments) * 0.5
+            else:
+                continue
+            if best is None or score > best[1]:
+                best = (category, score)
+    return best
+
+
+def _get(client: httpx.Client, url: str) -> httpx.Response | None:
+    try:
+        response = client.get(url)
+    except _REQUEST_ERRORS as e:
+        sampled_logger.debug("Discovery request failed for {}: {}", url, e)
+        return None
+    if response.status_code != 200:
+        return None
+    return response
+
+
+def _download_capped(client: httpx.Client, url: str, deadline: float) -> bytes | None:
+    """Stream a response body, stopping at MAX_SITEMAP_BYTES or the deadline."""
+    chunks: list[bytes] = []
+    size = 0
+    try:
+        with client.stream("GET", url) as response:
+            if response.status_code != 200:
+                return None
+            for chunk in response.iter_bytes():
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= MAX_SITEMAP_BYTES or time.monotonic() >= deadline:
+                    break
+    except _REQUEST_ERRORS as e:
+        sampled_logger.debug("Discovery request failed for {}: {}", url, e)
+        if not chunks:
+            return None
+    return b"".join(chunks)[:MAX_SITEMAP_BYTES]
+
+
+def _parse_robots(text: str) -> list[str]:
+    """Return the Sitemap URLs listed in a robots.txt body."""
+    sitemaps = []
+    for line in text.splitlines():
+        key, _, value = line.partition(":")
+        if key.strip().lower() == "sitemap" and value.strip():
+            sitemaps.append(value.strip())
+    return sitemaps
+
+
+def _sitemaps_from_robots(client: httpx.Client, origin: str) -> list[str]:
+    response = _get(client, f"{origin}/robots.txt")
+    if response is None:
+        return []
+    # Sitemap entries may be relative to the site root
+    return [urljoin(origin, sitemap) for sitemap in _parse_robots(response.text)]
+
+
+def _parse_sitemap(content: bytes) -> tuple[list[str], list[str]]:
+    """Parse sitemap XML into (page URLs, nested sitemap URLs).
+
+    Gzip content is decompressed as a stream and at most MAX_SITEMAP_BYTES of
+    XML are parsed incrementally. Truncated or malformed documents keep the
+    <loc> values read before the cut-off.
+    """
+    stream = gzip.GzipFile(fileobj=io.BytesIO(content)) if content[:2] == b"\x1f\x8b" else io.BytesIO(content)
+    parser = ET.XMLPullParser(events=("start", "end"))
+    locs: list[str] = []
+    is_index = False
+    remaining = MAX_SITEMAP_BYTES
+    try:
+        while remaining > 0:
+            chunk = stream.read(min(64 * 1024, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                if event == "start":
+                    if not locs and element.tag.endswith("sitemapindex"):
+                        is_index = True
+                elif element.tag.endswith("loc"):
+                    if element.text and element.text.strip():
+                        locs.append(element.text.strip())
+                elif element.tag.endswith(("url", "sitemap")):
+                    # Free finished entries so memory stays flat on large sitemaps
+                    element.clear()
+    except (ET.ParseError, OSError, EOFError) as e:
+        sampled_logger.debug("Stopped parsing sitemap after {} locations: {}", len(locs), e)
+    if is_index:
+        return [], locs
+    return locs, []
+
+
+def _collect_sitemap_urls(
+    client: httpx.Client,
+    executor: concurrent.futures.ThreadPoolExecutor,
+    sitemap_urls: list[str],
+    deadline: float,
+) -> tuple[list[str], list[str]]:
+    """Walk sitemaps and sitemap indexes level by level, fetching each level concurrently.
+
+    Bounded by MAX_SITEMAPS; sitemaps still downloading at the deadline are skipped.
+    """
+    pending = list(dict.fromkeys(sitemap_urls))
+    visited: list[str] = []
+    pages: list[str] = []
+    while pending and len(visited) < MAX_SITEMAPS:
+        batch = [u for u in pending if u not in visited][: MAX_SITEMAPS - len(visited)]
+        visited.extend(batch)
+        futures = {
+            executor.submit(contextvars.copy_context().run, _download_capped, client, u, deadline): u
+            for u in batch
+        }
+        done, _ = concurrent.futures.wait(futures, timeout=max(deadline - time.monotonic(), 0))
+        nested: list[str] = []
+        for future in done:
+            content = future.result()
+            if content is None:
+                continue
+            page_urls, child_sitemaps = _parse_sitemap(content)
+            pages.extend(page_urls)
+            nested.extend(child_sitemaps)
+        if time.monotonic() >= deadline:
+            sampled_logger.debug("Discovery budget exhausted after {} sitemaps", len(visited))
+            break
+        # Prefer nested sitemaps that look like they list pages rather than posts
+        nested.sort(key=lambda u: any(k in u.lower() for k in ("page", "main", "company")), reverse=True)
+        pending = [u for u in dict.fromkeys(nested) if u not in visited]
+    return pages, visited
+
+
+def _probe(client: httpx.Client, url: str) -> str | None:
+    try:
+        response = client.head(url)
+        # Some servers reject or mishandle HEAD; confirm with GET
+        if response.status_code in (403, 404, 405):
+            response = client.get(url)
+    except _REQUEST_ERRORS:
+        return None
+    if response.status_code != 200:
+        return None
+    return str(response.url)
+
+
+def discover_site_map(
+    url: str,
+    timeout: float = 10.0,
+    budget: float = DISCOVERY_BUDGET_SECONDS,
+) -> SiteMap:
+    """Discover key pages of a site without rendering it.
+
+    Reads robots.txt for sitemap locations, walks sitemap.xml (including
+    sitemap indexes and gzip-compressed sitemaps) and probes common paths
+    concurrently, then ranks same-host URLs into about, pricing, contact,
+    company and product categories. Probes are discarded when a random
+    path also answers 200 (soft-404 or single-page-app sites).
+
+    Args:
+        url: Any URL on the target site
+        timeout: Per-request timeout in seconds
+        budget: Overall time limit in seconds; work still in flight when it
+            runs out is abandoned and partial results are returned
+
+    Returns:
+        SiteMap with ranked candidate pages; empty if nothing was found
+    """
+    origin = _origin(url)
+    host = urlparse(origin).netloc
+    site_map = SiteMap(base_url=origin)
+    sampled_logger.debug("Discovering site structure for {}", origin)
+    deadline = time.monotonic() + budget
+
+    client = httpx.Client(follow_redirects=True, timeout=min(timeout, budget), headers=HEADERS)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(COMMON_PATHS) + MAX_SITEMAPS + 2)
+    # Run each task in a copy of the caller's context so bound log fields (request_id) carry over
+    control_future = executor.submit(
+        contextvars.copy_context().run, _probe, client, urljoin(origin, f"/{uuid.uuid4().hex}")
+    )
+    probe_futures = [
+        executor.submit(contextvars.copy_context().run, _probe, client, urljoin(origin, path))
+        for path in COMMON_PATHS
+    ]
+    robots_future = executor.submit(contextvars.copy_context().run, _sitemaps_from_robots, client, origin)
+    try:
+        concurrent.futures.wait([robots_future], timeout=max(deadline - time.monotonic(), 0))
+        robots_sitemaps = robots_future.result() if robots_future.done() else []
+        sitemap_pages, site_map.sitemaps = _collect_sitemap_urls(
+            client, executor, robots_sitemaps + [f"{origin}/sitemap.xml"], deadline
+        )
+        concurrent.futures.wait(
+            [control_future, *probe_futures], timeout=max(deadline - time.monotonic(), 0)
+        )
+        if control_future.done() and control_future.result() is None:
+            probed = [f.result() for f in probe_futures if f.done()]
+        else:
+            # The site answers 200 for anything (or the check did not finish); probes prove nothing
+            probed = []
+    finally:
+        # Do not wait for requests abandoned at the deadline; they fail fast once the client closes
+        executor.shutdown(wait=False, cancel_futures=True)
+        client.close()
+
+    candidates = [(u, "sitemap") for u in sitemap_pages] + [(u, "probe") for u in probed if u]
+    seen: set[str] = set()
+    for candidate, source in candidates:
+        normalized = candidate.split("#")[0].rstrip("/")
+        if normalized in seen or urlparse(normalized).netloc.removeprefix("www.") != host.removeprefix("www."):
+            continue
+        seen.add(normalized)
+        classified = _classify(normalized)
+        if classified:
+            category, score = classified
+            site_map.pages.append(DiscoveredPage(normalized, category, source, score))
+
+    sampled_logger.info(
+        "Discovered {} key pages for {} from {} sitemap URLs and {} probes",
+        len(site_map.pages),
+        origin,
+        len(sitemap_pages),
+        sum(1 for p in probed if p),
+    )
+    return site_map
@@ -0,0 +1,147 @@
+"""Optional process pool for CPU-bound HTML parsing."""
+from __future__ import annotations
+
+import atexit
+import concurrent.futures
+import multiprocessing
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+from loguru import logger
+
+# Documents smaller than this are parsed in the calling thread. This is a
+# conservative default, not a measured crossover: the only host it was
+# benchmarked on had a single core, where a process pool cannot speed up
+# CPU-bound parsing. Measure with benchmarks/bench_parse.py on the target
+# host and set SCRAPER_PARSE_INLINE_BYTES accordingly.
+DEFAULT_INLINE_THRESHOLD = 256 * 1024
+
+# Upper bound on waiting for a pooled parse before parsing in-thread instead
+PARSE_TIMEOUT_SECONDS = 30.0
+
+_pool: concurrent.futures.ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _worker_count() -> int:
+    """Read SCRAPER_PARSE_WORKERS; unset or 0 disables the pool, "auto" means one worker per core.
+
+    The pool is opt-in because starting it costs spawn time plus a bs4 import
+    per worker, which short-lived CLI jobs would pay on their first large page.
+    """
+    value = (os.getenv("SCRAPER_PARSE_WORKERS") or "").strip().lower()
+    if not value:
+        return 0
+    if value == "auto":
+        return os.cpu_count() or 1
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        logger.warning(f"Ignoring invalid SCRAPER_PARSE_WORKERS value: {value}")
+        return 0
+
+
+def parse_pool_enabled() -> bool:
+    """Whether SCRAPER_PARSE_WORKERS enables the pool; cheap, does not import bs4."""
+    return _worker_count() > 0
+
+
+def _inline_threshold() -> int:
+    value = os.getenv("SCRAPER_PARSE_INLINE_BYTES")
+    try:
+        return int(value) if value else DEFAULT_INLINE_THRESHOLD
+    except ValueError:
+        logger.warning(f"Ignoring invalid SCRAPER_PARSE_INLINE_BYTES value: {value}")
+        return DEFAULT_INLINE_THRESHOLD
+
+
+def get_parse_pool() -> concurrent.futures.ProcessPoolExecutor | None:
+    """Return the shared parse pool, creating it on first use.
+
+    Returns:
+        ProcessPoolExecutor sized by SCRAPER_PARSE_WORKERS, or None if disabled
+    """
+    global _pool
+    if _pool is not None:
+        return _pool
+    workers = _worker_count()
+    if workers == 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # Spawn rather than fork: callers run inside threaded servers
+            _pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            atexit.register(shutdown_parse_pool)
+            logger.debug("Started HTML parse pool with {} workers", workers)
+    return _pool
+
+
+def warm_parse_pool() -> None:
+    """Start the parse pool's workers ahead of the first request, if the pool is enabled."""
+    pool = get_parse_pool()
+    if pool is None:
+        return
+    from . import parser
+
+    # One tiny parse per worker forces each process to spawn and import bs4
+    futures = [pool.submit(parser.extract_text_and_links, b"<p></p>") for _ in range(_worker_count())]
+    concurrent.futures.wait(futures, timeout=PARSE_TIMEOUT_SECONDS)
+
+
+def shutdown_parse_pool() -> None:
+    """Shut down the shared parse pool if it was started."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def parse_html(
+    html: bytes,
+    encoding: str | None = None,
+    inline_threshold: int | None = None,
+) -> tuple[str, list[dict]]:
+    """Extract visible text and links, offloading large documents to the pool.
+
+    Small documents, or any document when the pool is disabled, are parsed
+    in the calling thread. If the pool is broken, shut down or does not
+    answer within PARSE_TIMEOUT_SECONDS, parsing falls back to the calling
+    thread.
+
+    Args:
+        html: Raw, undecoded HTML bytes
+        encoding: Optional charset hint, typically from the Content-Type header
+        inline_threshold: Override for the in-thread size limit in bytes
+
+    Returns:
+        Tuple of (cleaned text, list of {"href", "text"} dicts)
+    """
+    # Imported here so checking parse_pool_enabled() at startup does not load bs4
+    from . import parser
+
+    threshold = _inline_threshold() if inline_threshold is None else inline_threshold
+    if len(html) < threshold:
+        return parser.extract_text_and_links(html, encoding)
+
+    pool = get_parse_pool()
+    if pool is None:
+        return parser.extract_text_and_links(html, encoding)
+
+    try:
+        future = pool.submit(parser.extract_text_and_links, html, encoding)
+        return future.result(timeout=PARSE_TIMEOUT_SECONDS)
+    except BrokenProcessPool as e:
+        logger.warning(f"HTML parse pool unavailable, parsing in-thread: {str(e)}")
+        shutdown_parse_pool()
+    except RuntimeError as e:
+        # Another thread shut the pool down after we fetched it
+        logger.warning(f"HTML parse pool shut down, parsing in-thread: {str(e)}")
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        logger.warning(f"HTML parse pool timed out after {PARSE_TIMEOUT_SECONDS}s, parsing in-thread")
+    return parser.extract_text_and_links(html, encoding)
@@ -4,21 +4,54 @@ from __future__ import annotations
 from bs4 import BeautifulSoup
 
 
-def extract_visible_text(html: str) -> str:
+def _clean_soup(html: str | bytes, encoding: str | None = None) -> BeautifulSoup:
+    soup = BeautifulSoup(html, "html.parser", from_encoding=encoding if isinstance(html, bytes) else None)
+    for tag in soup(["script", "style", "noscript", "svg"]):
+        tag.decompose()
+    return soup
+
+
+def _soup_text(soup: BeautifulSoup) -> str:
+    text_chunks = [chunk.strip() for chunk in soup.stripped_strings if chunk.strip()]
+    return " \n".join(text_chunks)
+
+
+def extract_visible_text(html: str | bytes, encoding: str | None = None) -> str:
     """Extract and clean visible text from HTML for LLM processing.
-    
+
     Removes script, style, noscript, and svg tags, then extracts and
     normalizes the text content with proper whitespace handling.
-    
+
     Args:
-        html: Raw HTML content
-        
+        html: Raw HTML content, as text or undecoded bytes
+        encoding: Optional charset hint used when html is bytes
+
     Returns:
         Cleaned text content suitable for LLM analysis
     """
-    soup = BeautifulSoup(html, "html.parser")
-    for tag in soup(["script", "style", "noscript", "svg"]):
-        tag.decompose()
-    text_chunks = [chunk.strip() for chunk in soup.stripped_strings if chunk.strip()]
-    text = " \n".join(text_chunks)
-    return text
+    return _soup_text(_clean_soup(html, encoding))
+
+
+def extract_text_and_links(html: str | bytes, encoding: str | None = None) -> tuple[str, list[dict]]:
+    """Extract visible text and all non-empty anchor links from HTML.
+
+    Args:
+        html: Raw HTML content, as text or undecoded bytes
+        encoding: Optional charset hint used when html is bytes
+
+    Returns:
+        Tuple of (cleaned text, list of {"href", "text"} dicts)
+    """
+    soup = _clean_soup(html, encoding)
+    text = _soup_text(soup)
+
+    links = []
+    for link in soup.find_all("a", href=True):
+        href = link.get("href", "").strip()
+        link_text = link.get_text(strip=True)
+        if href and href != "#":
+            links.append({
+                "href": href,
+                "text": link_text if link_text else "[no text]"
+            })
+    return text, links
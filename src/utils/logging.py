@@ -1,31 +1,270 @@
 """Logging configuration for the scraper engine."""
-from loguru import logger
+from __future__ import annotations
+
+import json
+import os
+import queue
+import random
 import sys
+import threading
+import traceback
+import uuid
+from typing import Any, TextIO
+
+from loguru import logger
+
+DEFAULT_PRODUCTION_SAMPLE_RATE = 0.1
+
+# Records buffered per background writer before new ones are dropped
+WRITER_QUEUE_SIZE = 10_000
+
+# Fraction of sampled_logger debug/info calls that are emitted; set by configure_logging
+_sample_rate = 1.0
+
+CONSOLE_FORMAT = (
+    "<level>{level: <8}</level> | <magenta>{extra[request_id]}</magenta> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+)
+FILE_FORMAT = (
+    "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {extra[request_id]} | "
+    "{name}:{function}:{line} - {message}"
+)
+
+
+def new_request_id() -> str:
+    """Return a short random correlation id for one scrape."""
+    return uuid.uuid4().hex[:12]
+
+
+def _serialize(record: dict[str, Any]) -> str:
+    """Render a record as one compact JSON line."""
+    payload = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+    }
+    payload.update(record["extra"])
+    exception = record["exception"]
+    if exception is not None:
+        payload["exception"] = "".join(
+            traceback.format_exception(exception.type, exception.value, exception.traceback)
+        )
+    return json.dumps(payload, default=str) + "\n"
+
+
+def _json_format(record: dict[str, Any]) -> str:
+    """loguru format function producing JSON lines, for sinks loguru writes itself.
+
+    The record is shared with other sinks, including the background writer's
+    thread, so it is not mutated; braces are escaped because loguru treats
+    the returned string as a format template.
+    """
+    return _serialize(record).replace("{", "{{").replace("}", "}}")
+
+
+class _BackgroundWriter:
+    """Non-blocking sink: callers enqueue records, a daemon thread serializes and writes them.
+
+    The queue is bounded; when it is full new records are dropped and counted,
+    and the writer reports the count in its next line. Write errors (for
+    example a closed stderr) drop the affected batch without stopping the thread.
+    """
+
+    def __init__(self, stream: TextIO, maxsize: int = WRITER_QUEUE_SIZE):
+        self._stream = stream
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue(maxsize=maxsize)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, message: Any) -> None:
+        # loguru passes a str subclass carrying the raw record; serialization happens on the writer thread
+        try:
+            self._queue.put_nowait(message.record)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    def _take_dropped(self) -> int:
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, 0
+        return dropped
+
+    def _run(self) -> None:
+        while True:
+            record = self._queue.get()
+            # Drain whatever else is pending so bursts cost a single flush
+            batch = []
+            while record is not None:
+                batch.append(record)
+                try:
+                    record = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_batch(batch)
+                for _ in batch:
+                    self._queue.task_done()
+            if record is None:
+                self._queue.task_done()
+                return
+
+    def _write_batch(self, batch: list[dict[str, Any]]) -> None:
+        lines = []
+        dropped = self._take_dropped()
+        if dropped:
+            lines.append(json.dumps({
+                "level": "WARNING",
+                "logger": __name__,
+                "message": f"Dropped {dropped} log records: writer queue full",
+            }) + "\n")
+        for record in batch:
+            try:
+                lines.append(_serialize(record))
+            except Exception:
+                continue
+        try:
+            self._stream.write("".join(lines))
+            self._stream.flush()
+        except Exception:
+            # Nowhere left to report this; carry on so later lines still get a chance
+            pass
+
+    def drain(self) -> None:
+        """Block until every record enqueued so far has been written.
+
+        Deliberately not named flush: loguru calls a sink's flush after every write.
+        """
+        self._queue.join()
+
+    def stop(self) -> None:
+        """Flush pending records and stop the writer thread (called by logger.remove)."""
+        self._queue.put(None)
+        self._thread.join()
 
 
-def configure_logging(level: str = "DEBUG", log_file: str | None = None) -> None:
-    """Configure loguru logging with sensible defaults."""
+_writers: list[_BackgroundWriter] = []
+
+
+def flush_logging() -> None:
+    """Wait until background sinks have written everything logged so far."""
+    for writer in list(_writers):
+        writer.drain()
+
+
+class SampledLogger:
+    """Logger proxy for hot paths that drops a fraction of debug/info calls.
+
+    Sampling happens before loguru builds a record, so dropped calls cost
+    one random draw. Use loguru's logger directly for warnings and errors,
+    which should never be sampled.
+    """
+
+    def __init__(self, lazy: bool = False):
+        self._lazy = lazy
+
+    def opt(self, *, lazy: bool = False) -> SampledLogger:
+        return SampledLogger(lazy=lazy)
+
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log("DEBUG", message, args, kwargs)
+
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log("INFO", message, args, kwargs)
+
+    def _log(self, level: str, message: str, args: tuple, kwargs: dict) -> None:
+        if _sample_rate < 1.0 and random.random() >= _sample_rate:
+            return
+        # depth=2 attributes the record to the caller of debug()/info()
+        logger.opt(depth=2, lazy=self._lazy).log(level, message, *args, **kwargs)
+
+
+sampled_logger = SampledLogger()
+
+
+def configure_logging(
+    level: str = "DEBUG",
+    log_file: str | None = None,
+    production: bool = False,
+    sample_rate: float | None = None,
+) -> None:
+    """Configure loguru logging with sensible defaults.
+
+    Entry points call this explicitly; importing this module has no side effects.
+
+    Production mode writes compact JSON lines to stderr from a background
+    writer thread, which also does the serialization. The optional log file
+    keeps loguru's rotation and uses its enqueued sink; its JSON is rendered
+    on the calling thread.
+    Debug/info calls made through sampled_logger (the fetch and tool layers)
+    are kept at sample_rate.
+
+    Args:
+        level: Minimum log level
+        log_file: Optional path for a rotating log file
+        production: Use JSON output and non-blocking sinks
+        sample_rate: Fraction of sampled_logger debug/info calls to keep;
+            defaults to 1.0, or 0.1 in production mode
+    """
+    global _sample_rate
+    if sample_rate is None:
+        sample_rate = DEFAULT_PRODUCTION_SAMPLE_RATE if production else 1.0
+    _sample_rate = min(max(sample_rate, 0.0), 1.0)
+
     # Remove default handler
     logger.remove()
-    
+    _writers.clear()
+    logger.configure(extra={"request_id": "-"})
+
     # Add console handler
-    logger.add(
-        sys.stderr,
-        format="<level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-        level=level,
-        colorize=True
-    )
-    
+    if production:
+        writer = _BackgroundWriter(sys.stderr)
+        _writers.append(writer)
+        # The writer serializes message.record itself; keep loguru's per-call formatting minimal
+        logger.add(writer, format="{message}", level=level)
+    else:
+        logger.add(
+            sys.stderr,
+            format=CONSOLE_FORMAT,
+            level=level,
+            colorize=True
+        )
+
     # Add file handler if specified
     if log_file:
         logger.add(
             log_file,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+            format=_json_format if production else FILE_FORMAT,
             level=level,
+            enqueue=production,
             rotation="500 MB",
             retention="7 days"
         )
 
 
-# Configure on import
-configure_logging()
+def configure_logging_from_env() -> None:
+    """Configure logging from LOG_LEVEL, LOG_FILE, LOG_MODE and LOG_SAMPLE_RATE.
+
+    LOG_LEVEL defaults to INFO in production mode and DEBUG otherwise.
+    """
+    value = os.getenv("LOG_SAMPLE_RATE")
+    sample_rate = None
+    invalid_sample_rate = False
+    if value:
+        try:
+            sample_rate = float(value)
+        except ValueError:
+            invalid_sample_rate = True
+    production = os.getenv("LOG_MODE", "").lower() == "production"
+    configure_logging(
+        level=os.getenv("LOG_LEVEL", "INFO" if production else "DEBUG").upper(),
+        log_file=os.getenv("LOG_FILE") or None,
+        production=production,
+        sample_rate=sample_rate,
+    )
+    if invalid_sample_rate:
+        logger.warning(f"Ignoring invalid LOG_SAMPLE_RATE value: {value}")
@@ -0,0 +1,186 @@
+"""Tests for site structure discovery."""
+from __future__ import annotations
+
+import functools
+import gzip
+
+import httpx
+import pytest
+from loguru import logger
+
+from src.scraper import discovery
+from src.scraper.discovery import (
+    _classify,
+    _parse_robots,
+    _parse_sitemap,
+    _probe,
+    _sitemaps_from_robots,
+    discover_site_map,
+)
+
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def _urlset(urls: list[str]) -> bytes:
+    entries = "".join(f"<url><loc>{u}</loc></url>" for u in urls)
+    return f'<?xml version="1.0"?><urlset {NS}>{entries}</urlset>'.encode()
+
+
+@pytest.mark.parametrize(
+    ("url", "category"),
+    [
+        ("https://x.com/about-us", "about"),
+        ("https://x.com/about.html", "about"),
+        ("https://x.com/pricing", "pricing"),
+        ("https://x.com/press-releases", "company"),
+        ("https://x.com/contact-sales", "contact"),
+    ],
+)
+def test_classify_matches_whole_tokens(url, category):
+    assert _classify(url)[0] == category
+
+
+@pytest.mark.parametrize(
+    "url",
+    ["https://x.com/", "https://x.com/steam", "https://x.com/blog/wordpress-tips", "https://x.com/express"],
+)
+def test_classify_ignores_substring_matches(url):
+    assert _classify(url) is None
+
+
+def test_classify_prefers_shallow_exact_segments():
+    assert _classify("https://x.com/about")[1] > _classify("https://x.com/blog/2024/about-our-team")[1]
+
+
+def test_parse_robots_collects_sitemaps():
+    text = "User-agent: *\nDisallow: /admin\nSitemap: https://x.com/a.xml\nsitemap:https://x.com/b.xml.gz\n"
+    assert _parse_robots(text) == ["https://x.com/a.xml", "https://x.com/b.xml.gz"]
+
+
+def test_sitemaps_from_robots_resolves_relative_entries():
+    text = "Sitemap: /sitemap_index.xml\nSitemap: https://cdn.x.com/b.xml\n"
+    with _client(lambda request: httpx.Response(200, text=text)) as client:
+        assert _sitemaps_from_robots(client, "https://x.com") == [
+            "https://x.com/sitemap_index.xml",
+            "https://cdn.x.com/b.xml",
+        ]
+
+
+def test_parse_sitemap_urlset_and_index():
+    assert _parse_sitemap(_urlset(["https://x.com/a", "https://x.com/b"])) == (
+        ["https://x.com/a", "https://x.com/b"],
+        [],
+    )
+    index = f"<sitemapindex {NS}><sitemap><loc>https://x.com/s1.xml</loc></sitemap></sitemapindex>"
+    assert _parse_sitemap(index.encode()) == ([], ["https://x.com/s1.xml"])
+
+
+def test_parse_sitemap_gzip():
+    assert _parse_sitemap(gzip.compress(_urlset(["https://x.com/a"]))) == (["https://x.com/a"], [])
+
+
+def test_parse_sitemap_keeps_locations_before_truncation():
+    content = _urlset([f"https://x.com/p{i}" for i in range(100)])
+    pages, _ = _parse_sitemap(content[: len(content) // 2])
+    assert pages[:3] == ["https://x.com/p0", "https://x.com/p1", "https://x.com/p2"]
+    assert 0 < len(pages) < 100
+
+
+def test_parse_sitemap_caps_decompressed_size(monkeypatch):
+    monkeypatch.setattr(discovery, "MAX_SITEMAP_BYTES", 4096)
+    content = _urlset([f"https://x.com/p{i}" for i in range(10_000)])
+    pages, _ = _parse_sitemap(gzip.compress(content))
+    assert 0 < len(pages) < 10_000
+
+
+def test_parse_sitemap_invalid_xml():
+    assert _parse_sitemap(b"<html>not a sitemap") == ([], [])
+
+
+def _client(handler) -> httpx.Client:
+    return httpx.Client(transport=httpx.MockTransport(handler), follow_redirects=True)
+
+
+def test_probe_falls_back_to_get_when_head_is_rejected():
+    def handler(request):
+        return httpx.Response(404 if request.method == "HEAD" else 200)
+
+    with _client(handler) as client:
+        assert _probe(client, "https://x.com/about") == "https://x.com/about"
+
+
+def test_probe_rejects_non_200():
+    with _client(lambda request: httpx.Response(404)) as client:
+        assert _probe(client, "https://x.com/about") is None
+
+
+def _use_transport(monkeypatch, handler):
+    client = functools.partial(httpx.Client, transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(discovery.httpx, "Client", client)
+
+
+def test_discover_site_map_ranks_sitemap_and_probed_pages(monkeypatch):
+    def handler(request):
+        path = request.url.path
+        if path == "/robots.txt":
+            return httpx.Response(200, text="Sitemap: https://x.com/index.xml\n")
+        if path == "/index.xml":
+            body = f"<sitemapindex {NS}><sitemap><loc>https://x.com/pages.xml.gz</loc></sitemap></sitemapindex>"
+            return httpx.Response(200, content=body.encode())
+        if path == "/pages.xml.gz":
+            return httpx.Response(200, content=gzip.compress(_urlset(["https://x.com/pricing", "https://x.com/blog/post"])))
+        if path in ("/about", "/contact"):
+            return httpx.Response(200)
+        return httpx.Response(404)
+
+    _use_transport(monkeypatch, handler)
+    site_map = discover_site_map("https://x.com/home")
+    assert site_map.by_category() == {
+        "pricing": ["https://x.com/pricing"],
+        "about": ["https://x.com/about"],
+        "contact": ["https://x.com/contact"],
+    }
+
+
+def test_discover_site_map_ignores_probes_on_soft_404_sites(monkeypatch):
+    _use_transport(monkeypatch, lambda request: httpx.Response(200, text="<html>app shell</html>"))
+    assert discover_site_map("https://x.com/").pages == []
+
+
+def test_discover_site_map_skips_malformed_sitemap_urls(monkeypatch):
+    def handler(request):
+        path = request.url.path
+        if path == "/robots.txt":
+            return httpx.Response(200, text="Sitemap: /index.xml\n")
+        if path == "/index.xml":
+            locs = ("https://x.com/pages.xml", "https://x.com:80:80/bad.xml")
+            entries = "".join(f"<sitemap><loc>{loc}</loc></sitemap>" for loc in locs)
+            return httpx.Response(200, content=f"<sitemapindex {NS}>{entries}</sitemapindex>".encode())
+        if path == "/pages.xml":
+            return httpx.Response(200, content=_urlset(["https://x.com/pricing"]))
+        if path == "/about":
+            return httpx.Response(200)
+        return httpx.Response(404)
+
+    _use_transport(monkeypatch, handler)
+    site_map = discover_site_map("https://x.com/")
+    assert site_map.by_category() == {
+        "pricing": ["https://x.com/pricing"],
+        "about": ["https://x.com/about"],
+    }
+    assert "https://x.com/index.xml" in site_map.sitemaps
+
+
+def test_discover_site_map_logs_carry_request_id(monkeypatch):
+    _use_transport(monkeypatch, lambda request: httpx.Response(404))
+    records = []
+    logger.remove()
+    logger.configure(extra={"request_id": "-"})
+    logger.add(lambda message: records.append(message.record), level="DEBUG")
+    try:
+        with logger.contextualize(request_id="req-1"):
+            discover_site_map("https://x.com:80:80/")
+    finally:
+        logger.remove()
+    assert records
+    assert {r["extra"]["request_id"] for r in records} == {"req-1"}
@@ -0,0 +1,150 @@
+"""Tests for logging configuration and the production sinks."""
+from __future__ import annotations
+
+import io
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+from loguru import logger
+
+from src.ai.utils.tool_handler import ToolHandler, ToolRegistry
+from src.utils import logging as scraper_logging
+from src.utils.logging import _BackgroundWriter, configure_logging, configure_logging_from_env, flush_logging
+
+
+@pytest.fixture(autouse=True)
+def _reset_logger():
+    yield
+    logger.remove()
+    scraper_logging._sample_rate = 1.0
+
+
+def _production_lines(capsys) -> list[dict]:
+    flush_logging()
+    return [json.loads(line) for line in capsys.readouterr().err.splitlines()]
+
+
+def test_production_json_includes_request_id_and_traceback(capsys):
+    configure_logging(production=True)
+    with logger.contextualize(request_id="abc"):
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            logger.exception("boom")
+    (line,) = _production_lines(capsys)
+    assert line["message"] == "boom"
+    assert line["request_id"] == "abc"
+    assert "Traceback" in line["exception"]
+    assert "ZeroDivisionError: division by zero" in line["exception"]
+
+
+def test_sampled_logger_drops_at_rate_zero_but_keeps_warnings(capsys):
+    configure_logging(production=True, sample_rate=0.0)
+    scraper_logging.sampled_logger.info("sampled out")
+    logger.warning("kept")
+    assert [line["message"] for line in _production_lines(capsys)] == ["kept"]
+
+
+class _BrokenStream:
+    def __init__(self):
+        self.calls = 0
+
+    def write(self, text):
+        self.calls += 1
+        if self.calls == 1:
+            raise ValueError("I/O operation on closed file")
+
+    def flush(self):
+        pass
+
+
+def test_background_writer_survives_write_errors():
+    stream = _BrokenStream()
+    writer = _BackgroundWriter(stream)
+    logger.remove()
+    logger.add(writer, format="{message}")
+    logger.info("first")
+    writer.drain()
+    logger.info("second")
+    writer.drain()
+    assert stream.calls == 2
+    logger.remove()
+
+
+class _BlockingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text):
+        self.release.wait()
+        return super().write(text)
+
+
+def test_background_writer_drops_and_reports_when_full():
+    stream = _BlockingStream()
+    writer = _BackgroundWriter(stream, maxsize=2)
+    logger.remove()
+    logger.add(writer, format="{message}")
+    for i in range(20):
+        logger.info("line {}", i)
+    stream.release.set()
+    writer.drain()
+    logger.info("after")
+    writer.drain()
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert len(lines) < 21
+    assert any(line["message"].startswith("Dropped ") for line in lines)
+    assert lines[-1]["message"] == "after"
+    logger.remove()
+
+
+def test_invalid_sample_rate_from_env_warns_instead_of_raising(monkeypatch, capsys):
+    monkeypatch.setenv("LOG_MODE", "production")
+    monkeypatch.setenv("LOG_SAMPLE_RATE", "ten percent")
+    configure_logging_from_env()
+    (line,) = _production_lines(capsys)
+    assert line["level"] == "WARNING"
+    assert "LOG_SAMPLE_RATE" in line["message"]
+    assert scraper_logging._sample_rate == scraper_logging.DEFAULT_PRODUCTION_SAMPLE_RATE
+
+
+def test_production_log_file_is_json_with_braces(tmp_path, capsys):
+    log_file = tmp_path / "scraper.log"
+    configure_logging(production=True, log_file=str(log_file))
+    with logger.contextualize(request_id="abc"):
+        logger.info("payload {}", {"key": "value"})
+    logger.complete()
+    flush_logging()
+    (line,) = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert line["message"] == "payload {'key': 'value'}"
+    assert line["request_id"] == "abc"
+    assert "_json" not in _production_lines(capsys)[0]
+
+
+def test_request_id_reaches_tool_threads():
+    records = []
+    logger.remove()
+    logger.configure(extra={"request_id": "-"})
+    logger.add(lambda message: records.append(message.record), level="DEBUG")
+
+    def lookup(query: str) -> str:
+        logger.info("looking up {}", query)
+        return query
+
+    registry = ToolRegistry()
+    registry.register("lookup", {"name": "lookup"}, lookup)
+    calls = [
+        SimpleNamespace(id=f"call-{i}", function=SimpleNamespace(name="lookup", arguments=json.dumps({"query": str(i)})))
+        for i in range(2)
+    ]
+    with logger.contextualize(request_id="req-1"):
+        results = ToolHandler(registry).execute_parallel(calls)
+
+    assert [r.content for r in results] == ["0", "1"]
+    tool_records = [r for r in records if r["function"] == "lookup"]
+    assert len(tool_records) == 2
+    assert all(r["thread"].id != threading.get_ident() for r in tool_records)
+    assert {r["extra"]["request_id"] for r in tool_records} == {"req-1"}
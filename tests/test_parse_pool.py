@@ -0,0 +1,98 @@
+"""Tests for the optional HTML parse pool."""
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from src.scraper import parse_pool
+from src.scraper.parse_pool import parse_html
+
+HTML = b"<p>Hello</p><a href='/about'>About</a><script>x()</script>"
+EXPECTED = ("Hello \nAbout", [{"href": "/about", "text": "About"}])
+
+
+class _ShutDownPool:
+    def submit(self, *args, **kwargs):
+        raise RuntimeError("cannot schedule new futures after shutdown")
+
+
+class _BrokenPool:
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool("worker died")
+
+
+class _HungPool:
+    def submit(self, *args, **kwargs):
+        return concurrent.futures.Future()
+
+
+def test_pool_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("SCRAPER_PARSE_WORKERS", raising=False)
+    assert parse_pool.get_parse_pool() is None
+    assert parse_html(HTML, inline_threshold=0) == EXPECTED
+
+
+@pytest.mark.parametrize(("value", "expected"), [("0", 0), ("3", 3), ("bogus", 0)])
+def test_worker_count(monkeypatch, value, expected):
+    monkeypatch.setenv("SCRAPER_PARSE_WORKERS", value)
+    assert parse_pool._worker_count() == expected
+
+
+@pytest.mark.parametrize("pool", [_ShutDownPool(), _BrokenPool()])
+def test_parse_html_falls_back_in_thread(monkeypatch, pool):
+    monkeypatch.setattr(parse_pool, "get_parse_pool", lambda: pool)
+    monkeypatch.setattr(parse_pool, "shutdown_parse_pool", lambda: None)
+    assert parse_html(HTML, inline_threshold=0) == EXPECTED
+
+
+def test_parse_html_falls_back_on_timeout(monkeypatch):
+    monkeypatch.setattr(parse_pool, "get_parse_pool", lambda: _HungPool())
+    monkeypatch.setattr(parse_pool, "PARSE_TIMEOUT_SECONDS", 0.01)
+    assert parse_html(HTML, inline_threshold=0) == EXPECTED
+
+
+@pytest.mark.parametrize(("value", "expected"), [("", False), ("0", False), ("bogus", False), ("2", True)])
+def test_parse_pool_enabled(monkeypatch, value, expected):
+    monkeypatch.setenv("SCRAPER_PARSE_WORKERS", value)
+    assert parse_pool.parse_pool_enabled() is expected
+
+
+def _run_lifespan(monkeypatch, body=None):
+    from src import api
+
+    # Leave the test session's logging configuration alone
+    monkeypatch.setattr(api, "configure_logging_from_env", lambda: None)
+
+    async def run():
+        async with api.lifespan(api.app):
+            if body:
+                body()
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("value", ["0", "bogus"])
+def test_lifespan_skips_pool_when_disabled(monkeypatch, value):
+    monkeypatch.setenv("SCRAPER_PARSE_WORKERS", value)
+    calls = []
+    monkeypatch.setattr(parse_pool, "warm_parse_pool", lambda: calls.append("warm"))
+    monkeypatch.setattr(parse_pool, "shutdown_parse_pool", lambda: calls.append("shutdown"))
+    _run_lifespan(monkeypatch)
+    assert calls == []
+
+
+def test_lifespan_shuts_pool_down_when_app_fails(monkeypatch):
+    monkeypatch.setenv("SCRAPER_PARSE_WORKERS", "1")
+    calls = []
+    monkeypatch.setattr(parse_pool, "warm_parse_pool", lambda: calls.append("warm"))
+    monkeypatch.setattr(parse_pool, "shutdown_parse_pool", lambda: calls.append("shutdown"))
+
+    def fail():
+        raise RuntimeError("app crashed")
+
+    with pytest.raises(RuntimeError):
+        _run_lifespan(monkeypatch, fail)
+    assert calls == ["warm", "shutdown"]